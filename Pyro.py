@@ -1,46 +1,221 @@
 import sys
 import os
 import shutil
+import socket
+import tempfile
+import threading
+from collections import deque
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QLabel, QListWidget, QPushButton, QTextEdit,
     QVBoxLayout, QHBoxLayout, QWidget, QFileDialog, QGroupBox, QFormLayout,
     QInputDialog, QMessageBox, QLineEdit
 )
-from PyQt5.QtCore import Qt, pyqtSignal, pyqtSlot, QProcess, QObject
-from PyQt5.QtNetwork import QTcpSocket
-from PyQt5.QtGui import QFont
+from PyQt5.QtCore import Qt, pyqtSignal, pyqtSlot, QProcess, QObject, QRunnable, QThreadPool, QThread, QTimer
+from PyQt5.QtGui import QTextCursor
+
+def _fast_copy(src, dst):
+    """Copy src to dst in the kernel with sendfile(), preserving the permission bits like shutil.copy."""
+    try:
+        if os.path.samefile(src, dst):
+            return  # Re-importing a file that already lives in the config dir
+    except FileNotFoundError:
+        pass
+    # Copy into a temporary sibling so dst is only replaced by a complete copy
+    fd, tmp = tempfile.mkstemp(prefix='.' + os.path.basename(dst) + '.', dir=os.path.dirname(dst))
+    try:
+        with open(src, 'rb') as s, os.fdopen(fd, 'wb') as d:
+            size = os.fstat(s.fileno()).st_size
+            offset = 0
+            try:
+                while offset < size:
+                    sent = os.sendfile(d.fileno(), s.fileno(), offset, size - offset)
+                    if sent == 0:
+                        break
+                    offset += sent
+            except (AttributeError, OSError):
+                # No file-to-file sendfile on this platform; fall back to a userspace copy
+                s.seek(offset)
+                d.seek(offset)
+                shutil.copyfileobj(s, d)
+        shutil.copymode(src, tmp)
+        os.replace(tmp, dst)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
 
 # Configuration Manager: Handles importing and listing OpenVPN configs
 class ConfigManager:
+    # Directives whose argument is a file that must be copied alongside the config
+    FILE_DIRECTIVES = frozenset(('ca', 'cert', 'key', 'tls-auth', 'tls-crypt'))
+
     def __init__(self):
         super().__init__()
         self.config_dir = os.path.expanduser('~/.openvpn-gui/configs')
         os.makedirs(self.config_dir, exist_ok=True)
+        self.index_path = os.path.join(self.config_dir, 'index.txt')
+        self._cache = None  # (st_mtime_ns, names) of the last directory scan
+        self._lock = threading.Lock()  # Imports run on pool threads; keeps index updates atomic
+        self.config_paths = {}  # config name -> path of its .ovpn file
 
     def import_config(self, ovpn_path):
         """Import an .ovpn file and its referenced files."""
-        config_name = os.path.basename(ovpn_path).replace('.ovpn', '')
+        ovpn_path = os.fspath(ovpn_path)
+        config_name, _ = os.path.splitext(os.path.basename(ovpn_path))
         config_subdir = os.path.join(self.config_dir, config_name)
-        os.makedirs(config_subdir, exist_ok=True)
-        dest_ovpn = os.path.join(config_subdir, os.path.basename(ovpn_path))
-        shutil.copy(ovpn_path, dest_ovpn)
-        # Copy any referenced files (e.g., certificates)
-        with open(ovpn_path, 'r') as f:
-            for line in f:
-                line = line.strip()
-                if line.startswith(('ca ', 'cert ', 'key ', 'tls-auth ', 'tls-crypt ')):
-                    parts = line.split()
-                    if len(parts) > 1:
-                        file_path = parts[1]
-                        if not os.path.isabs(file_path):
-                            file_path = os.path.join(os.path.dirname(ovpn_path), file_path)
-                        if os.path.exists(file_path):
-                            shutil.copy(file_path, config_subdir)
+        with self._lock:
+            # Only extend an index that still matches the directory; a stale one gets rebuilt
+            index_current = self._read_index(os.stat(self.config_dir).st_mtime_ns) is not None
+            is_new = not os.path.isdir(config_subdir)
+            os.makedirs(config_subdir, exist_ok=True)
+            self._cache = None
+            if is_new and index_current:
+                with open(self.index_path, 'a') as f:
+                    f.write(config_name + '\n')
+        # Named the way list_configs maps config names to .ovpn paths
+        dest_ovpn = os.path.join(config_subdir, f"{config_name}.ovpn")
+        _fast_copy(ovpn_path, dest_ovpn)
+        # Copy any referenced files (e.g., certificates), once each
+        with open(ovpn_path, 'r', encoding='utf-8', errors='replace') as f:
+            text = f.read()
+        ovpn_dir = os.path.dirname(ovpn_path)
+        referenced = set()
+        for line in text.splitlines():
+            parts = line.split(None, 2)
+            if len(parts) > 1 and parts[0] in self.FILE_DIRECTIVES:
+                file_path = parts[1]
+                if not os.path.isabs(file_path):
+                    file_path = os.path.join(ovpn_dir, file_path)
+                referenced.add(file_path)
+        for file_path in referenced:
+            try:
+                _fast_copy(file_path, os.path.join(config_subdir, os.path.basename(file_path)))
+            except FileNotFoundError:
+                pass
         return config_name
 
     def list_configs(self):
-        """Return a list of available config names."""
-        return [d for d in os.listdir(self.config_dir) if os.path.isdir(os.path.join(self.config_dir, d))]
+        """Return a list of available config names, rescanning only when the directory changes."""
+        with self._lock:
+            st = os.stat(self.config_dir)
+            if self._cache is not None and self._cache[0] == st.st_mtime_ns:
+                return list(self._cache[1])
+            entries = self._read_index(st.st_mtime_ns)
+            if entries is None:
+                # DirEntry.is_dir() uses the type reported by readdir, avoiding a stat per entry
+                with os.scandir(self.config_dir) as it:
+                    entries = [e.name for e in it if e.is_dir(follow_symlinks=False)]
+                self._write_index(entries)
+                st = os.stat(self.config_dir)  # Creating the index may have touched the directory
+            self._cache = (st.st_mtime_ns, entries)
+            self.config_paths = {
+                name: os.path.join(self.config_dir, name, f"{name}.ovpn") for name in entries
+            }
+            return list(entries)
+
+    def _read_index(self, dir_mtime_ns):
+        """Return the names in the index file, or None if it is missing or not newer than the directory."""
+        try:
+            # Equal timestamps can't be ordered at coarse mtime granularity, so rescan
+            if os.stat(self.index_path).st_mtime_ns <= dir_mtime_ns:
+                return None
+            with open(self.index_path, 'r') as f:
+                return [name for name in f.read().splitlines() if name]
+        except OSError:
+            return None
+
+    def _write_index(self, names):
+        """Rewrite the index file from a fresh directory scan."""
+        try:
+            with open(self.index_path, 'w') as f:
+                f.writelines(name + '\n' for name in names)
+        except OSError:
+            pass
+
+# Import Task: Runs ConfigManager.import_config on a worker thread
+class ImportSignals(QObject):
+    finished = pyqtSignal(str)
+    failed = pyqtSignal(str)
+
+class ImportTask(QRunnable):
+    def __init__(self, config_manager, ovpn_path):
+        super().__init__()
+        self.config_manager = config_manager
+        self.ovpn_path = ovpn_path
+        self.signals = ImportSignals()
+
+    def run(self):
+        """Copy the config off the GUI thread and report the result via signals."""
+        try:
+            config_name = self.config_manager.import_config(self.ovpn_path)
+        except (OSError, ValueError) as e:
+            self.signals.failed.emit(str(e))
+        else:
+            self.signals.finished.emit(config_name)
+
+# Management Reader: Connects to the OpenVPN management socket and runs a blocking recv loop
+class ManagementReader(QThread):
+    connected = pyqtSignal()
+
+    def __init__(self, controller, address):
+        super().__init__()
+        self.controller = controller
+        self.address = address
+        self.sock = None
+
+    def stop(self):
+        """Abort connection retries or wake the thread out of recv()."""
+        self.requestInterruption()
+        if self.sock is not None:
+            try:
+                self.sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+
+    def open_socket(self):
+        """Create a management socket with its options applied before connecting."""
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        # Management commands are tiny; don't let Nagle hold them back
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        # Room for large log dumps without stalling OpenVPN's writes
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, 262144)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 262144)
+        return sock
+
+    def run(self):
+        """Connect with backoff, then read the socket in large chunks until it is shut down."""
+        # No deadline: the wait includes the pkexec prompt, and the controller stops
+        # the reader when the process exits
+        delay = 100
+        while not self.isInterruptionRequested():
+            sock = self.open_socket()
+            try:
+                sock.connect(self.address)
+            except OSError:
+                sock.close()
+                self.msleep(delay)
+                delay = min(delay * 2, 1000)
+                continue
+            self.sock = sock
+            break
+        # stop() may have run before self.sock was published
+        if self.sock is None or self.isInterruptionRequested():
+            return
+        self.connected.emit()
+        # Receive into one reusable chunk so each read is copied only into the line buffer
+        chunk = bytearray(65536)
+        view = memoryview(chunk)
+        while True:
+            try:
+                n = self.sock.recv_into(chunk)
+            except OSError:
+                break
+            if not n:
+                break
+            self.controller.feed(view[:n])
 
 # OpenVPN Controller: Manages the OpenVPN process and socket communication
 class OpenVPNController(QObject):
@@ -51,61 +226,150 @@ class OpenVPNController(QObject):
     def __init__(self):
         super().__init__()
         self.process = QProcess()
-        self.socket = QTcpSocket()
-        self.buffer = b''
+        self.process.started.connect(self._on_proc_started)
+        self.process.errorOccurred.connect(self._on_proc_error)
+        self.process.finished.connect(self._on_proc_finished)
+        self.socket = None
+        self.reader = None
+        self.buffer = bytearray()
         self.current_state = 'DISCONNECTED'
         self.details = {}
+        # Management message prefixes and their payload handlers
+        self.handlers = {
+            b'>STATE:': self._on_state,
+            b'>LOG:': self._on_log,
+            b'>PASSWORD:': self._on_password,
+        }
 
     def start_openvpn(self, config_path):
-        """Start OpenVPN with the given config and connect to its management socket."""
+        """Start OpenVPN with the given config; the management socket is connected once it runs."""
         self.process.start('pkexec', ['openvpn', '--config', config_path, '--management', '127.0.0.1', '7505'])
-        self.process.waitForStarted(2000)
-        self.socket.connectToHost('127.0.0.1', 7505)
-        if self.socket.waitForConnected(2000):
-            self.socket.readyRead.connect(self.on_ready_read)
-            self.send_command('state on')
-            self.send_command('log on')
-            self.send_command('hold release')
-        else:
-            self.log_message.emit("Error: Could not connect to OpenVPN management socket.")
+
+    @pyqtSlot()
+    def _on_proc_started(self):
+        """Begin connecting to the management socket on the reader thread."""
+        if self.reader is not None:  # Retire the reader left over from the previous run
+            self.reader.stop()
+            self.reader.wait()
+            if self.reader.sock is not None:
+                self.reader.sock.close()
+        self.buffer.clear()
+        self.current_state = 'DISCONNECTED'
+        self.details = {}
+        self.reader = ManagementReader(self, ('127.0.0.1', 7505))
+        self.reader.connected.connect(self._on_socket_connected)
+        self.reader.start()
+
+    @pyqtSlot()
+    def _on_socket_connected(self):
+        """Enable state and log notifications and let OpenVPN proceed."""
+        if self.reader is None:  # Disconnected before the queued signal arrived
+            return
+        self.socket = self.reader.sock
+        self.send_commands('state on', 'log on', 'hold release')
+
+    def _on_proc_error(self, error):
+        """Report a pkexec/OpenVPN process that could not be launched."""
+        if error == QProcess.FailedToStart:
+            self.log_message.emit("Error: Could not start OpenVPN.")
+
+    def _on_proc_finished(self, exit_code, exit_status):
+        """Stop the management reader once OpenVPN has exited."""
+        if self.reader is not None:
+            self.reader.stop()
 
     def disconnect(self):
         """Disconnect the VPN by sending SIGTERM."""
+        if self.socket is None and self.process.state() != QProcess.NotRunning:
+            self.process.terminate()  # Still in the pkexec prompt; no management socket yet
         self.send_command('signal SIGTERM')
         self.process.waitForFinished(2000)
-        self.socket.disconnectFromHost()
+        if self.reader is not None:
+            self.reader.stop()
+            self.reader.wait()
+            if self.reader.sock is not None:
+                self.reader.sock.close()
+            self.reader = None
+        self.socket = None
 
     def send_command(self, command):
         """Send a command to the OpenVPN management socket."""
-        if self.socket.state() == QTcpSocket.ConnectedState:
-            self.socket.write((command + '\n').encode('utf-8'))
+        self.send_commands(command)
 
-    @pyqtSlot()
-    def on_ready_read(self):
-        """Process incoming data from the management socket."""
-        data = self.socket.readAll()
-        self.buffer += data
-        lines = self.buffer.split(b'\n')
-        self.buffer = lines.pop()
-        for line in lines:
-            self.process_line(line.decode('utf-8').strip())
+    def send_commands(self, *commands):
+        """Send several commands to the OpenVPN management socket in a single write."""
+        if self.socket is not None:
+            try:
+                self.socket.sendall(''.join(command + '\n' for command in commands).encode('utf-8'))
+            except OSError:
+                pass
+
+    def feed(self, data):
+        """Process data received from the management socket (called on the reader thread)."""
+        self.buffer.extend(data)
+        logs = []
+        # Consume complete lines from the head in place instead of re-splitting the whole buffer
+        while (i := self.buffer.find(b'\n')) != -1:
+            line = bytes(self.buffer[:i])
+            del self.buffer[:i + 1]
+            log_message = self.process_line(line)
+            if log_message is not None:
+                logs.append(log_message)
+        # One emission per recv() keeps the log viewer from reflowing per line
+        if logs:
+            self.log_message.emit('\n'.join(logs))
 
     def process_line(self, line):
-        """Parse management socket messages and emit signals."""
-        if line.startswith('>STATE:'):
-            parts = line[7:].split(',')
-            state = parts[1]
-            self.current_state = state
-            if state == 'CONNECTED':
-                self.details = {'remote_ip': parts[4], 'local_ip': parts[3]}
-            else:
-                self.details = {}
-            self.state_changed.emit(state, self.details)
-        elif line.startswith('>LOG:'):
-            log_message = line.split(',', 2)[2]
-            self.log_message.emit(log_message)
-        elif line.startswith('>PASSWORD:'):
-            self.auth_required.emit()
+        """Dispatch a raw management socket line on its prefix; return the text of a log line."""
+        for prefix, handler in self.handlers.items():
+            if line.startswith(prefix):
+                return handler(line[len(prefix):].rstrip(b'\r'))
+
+    def _on_state(self, payload):
+        """Handle a >STATE: message and emit the new state if it changed."""
+        parts = payload.decode('utf-8', 'replace').split(',')
+        state = parts[1]
+        if state == 'CONNECTED':
+            details = {'remote_ip': parts[4], 'local_ip': parts[3]}
+        else:
+            details = {}
+        # Repeated identical states would only repaint the same status widgets
+        if (state, details) == (self.current_state, self.details):
+            return
+        self.current_state = state
+        self.details = details
+        self.state_changed.emit(state, self.details)
+
+    def _on_log(self, payload):
+        """Handle a >LOG: message, decoding only the message text."""
+        return payload.split(b',', 2)[2].decode('utf-8', 'replace')
+
+    def _on_password(self, payload):
+        """Handle a >PASSWORD: request."""
+        self.auth_required.emit()
+
+# Retro theme, applied once to the whole application; widgets are matched by objectName,
+# and the "X, X QWidget" pairs carry each rule down to children such as scrollbars
+STYLESHEET = """
+QMainWindow, QMainWindow QWidget {
+    background-color: black;
+}
+QLabel#title {
+    color: #00ff00; font-family: 'VT323'; font-size: 24px;
+}
+QListWidget#configList, QListWidget#configList QWidget, QPushButton#actionButton {
+    background-color: #1a1a1a; color: #00ff00; border: 2px solid #00ff00; font-family: 'VT323'; font-size: 16px;
+}
+QGroupBox#statusGroup, QGroupBox#statusGroup QWidget {
+    color: #00ff00; font-family: 'VT323'; font-size: 14px;
+}
+QStatusBar {
+    color: #00ff00; font-family: 'VT323'; font-size: 14px;
+}
+QTextEdit#logViewer, QTextEdit#logViewer QWidget {
+    background-color: black; color: #00ff00; font-family: 'VT323'; font-size: 14px; border: 2px solid #00ff00;
+}
+"""
 
 # Main Window: The GUI with a vintage hacker aesthetic
 class MainWindow(QMainWindow):
@@ -127,12 +391,11 @@ class MainWindow(QMainWindow):
         central_widget = QWidget()
         self.setCentralWidget(central_widget)
         main_layout = QVBoxLayout(central_widget)
-        self.setStyleSheet("background-color: black;")
 
         # Title
         self.title_label = QLabel("OpenVPN Client")
         self.title_label.setAlignment(Qt.AlignCenter)
-        self.title_label.setStyleSheet("color: #00ff00; font-family: 'VT323'; font-size: 24px;")
+        self.title_label.setObjectName("title")
         main_layout.addWidget(self.title_label)
 
         # Main content layout
@@ -141,9 +404,7 @@ class MainWindow(QMainWindow):
 
         # Config list
         self.config_list = QListWidget()
-        self.config_list.setStyleSheet(
-            "background-color: #1a1a1a; color: #00ff00; border: 2px solid #00ff00; font-family: 'VT323'; font-size: 16px;"
-        )
+        self.config_list.setObjectName("configList")
         content_layout.addWidget(self.config_list)
 
         # Buttons
@@ -151,16 +412,15 @@ class MainWindow(QMainWindow):
         self.import_button = QPushButton("Import Config")
         self.connect_button = QPushButton("Connect")
         self.disconnect_button = QPushButton("Disconnect")
-        for btn in [self.import_button, self.connect_button, self.disconnect_button]:
-            btn.setStyleSheet(
-                "background-color: #1a1a1a; color: #00ff00; border: 2px solid #00ff00; font-family: 'VT323'; font-size: 16px;"
-            )
+        self.clear_log_button = QPushButton("Clear Log")
+        for btn in [self.import_button, self.connect_button, self.disconnect_button, self.clear_log_button]:
+            btn.setObjectName("actionButton")
             button_layout.addWidget(btn)
         content_layout.addLayout(button_layout)
 
         # Status box
         self.status_group = QGroupBox("Connection Status")
-        self.status_group.setStyleSheet("color: #00ff00; font-family: 'VT323'; font-size: 14px;")
+        self.status_group.setObjectName("statusGroup")
         form_layout = QFormLayout()
         self.status_label = QLabel("Disconnected")
         self.server_label = QLabel("N/A")
@@ -174,11 +434,18 @@ class MainWindow(QMainWindow):
         # Log viewer
         self.log_viewer = QTextEdit()
         self.log_viewer.setReadOnly(True)
-        self.log_viewer.setStyleSheet(
-            "background-color: black; color: #00ff00; font-family: 'VT323'; font-size: 14px; border: 2px solid #00ff00;"
-        )
+        # Drop the oldest lines so appends stay cheap in long sessions
+        self.log_viewer.document().setMaximumBlockCount(10000)
+        self.log_viewer.setObjectName("logViewer")
         main_layout.addWidget(self.log_viewer)
 
+        # Pending log lines, flushed into the viewer at most ~30 times a second;
+        # older lines beyond the viewer's own cap would be trimmed on insert anyway
+        self._log_q = deque(maxlen=10000)
+        self.log_timer = QTimer(self)
+        self.log_timer.setInterval(33)
+        self.log_timer.timeout.connect(self._drain_log)
+
     def load_configs(self):
         """Populate the config list with available configurations."""
         self.config_list.clear()
@@ -190,9 +457,22 @@ class MainWindow(QMainWindow):
         """Handle importing a new config file."""
         ovpn_path, _ = QFileDialog.getOpenFileName(self, "Select OpenVPN Config", "", "OpenVPN Config (*.ovpn)")
         if ovpn_path:
-            config_name = self.config_manager.import_config(ovpn_path)
-            self.load_configs()
-            QMessageBox.information(self, "Success", f"Configuration '{config_name}' imported successfully.")
+            task = ImportTask(self.config_manager, ovpn_path)
+            task.signals.finished.connect(self.on_import_finished)
+            task.signals.failed.connect(self.on_import_failed)
+            QThreadPool.globalInstance().start(task)
+
+    @pyqtSlot(str)
+    def on_import_finished(self, config_name):
+        """Refresh the config list once a background import completes."""
+        self.load_configs()
+        # A transient status message instead of a modal box keeps batch imports quick
+        self.statusBar().showMessage(f"Configuration '{config_name}' imported successfully.", 3000)
+
+    @pyqtSlot(str)
+    def on_import_failed(self, error):
+        """Report a background import that could not be completed."""
+        QMessageBox.warning(self, "Error", f"Could not import configuration: {error}")
 
     @pyqtSlot()
     def on_connect_clicked(self):
@@ -202,7 +482,10 @@ class MainWindow(QMainWindow):
             QMessageBox.warning(self, "Error", "Please select a configuration to connect.")
             return
         config_name = selected_items[0].text()
-        config_path = os.path.join(self.config_manager.config_dir, config_name, f"{config_name}.ovpn")
+        config_path = self.config_manager.config_paths.get(config_name)
+        if config_path is None or not os.path.isfile(config_path):
+            QMessageBox.warning(self, "Error", f"Configuration file for '{config_name}' was not found.")
+            return
         self.connect_signal.emit(config_path)
 
     @pyqtSlot()
@@ -225,13 +508,36 @@ class MainWindow(QMainWindow):
 
     @pyqtSlot(str)
     def append_log(self, message):
-        """Append a log message and auto-scroll if at bottom."""
+        """Queue log lines for the next log viewer refresh."""
+        self._log_q.extend(message.split('\n'))
+        if not self.log_timer.isActive():  # The timer only runs while lines are pending
+            self.log_timer.start()
+
+    @pyqtSlot()
+    def _drain_log(self):
+        """Append all queued log lines at once and auto-scroll if at bottom."""
+        self.log_timer.stop()
+        if not self._log_q:
+            return
+        message = '\n'.join(self._log_q)
+        self._log_q.clear()
+        # One scrollbar check per batch, taken before the insert grows the document
         scroll_bar = self.log_viewer.verticalScrollBar()
         at_bottom = scroll_bar.value() == scroll_bar.maximum()
-        self.log_viewer.append(message)
+        cursor = QTextCursor(self.log_viewer.document())
+        cursor.movePosition(QTextCursor.End)
+        if not self.log_viewer.document().isEmpty():
+            message = '\n' + message  # Start a new line without leaving a trailing empty block
+        cursor.insertText(message)
         if at_bottom:  # Ensure the scrollbar stays at the bottom if it was already there.
             scroll_bar.setValue(scroll_bar.maximum())
 
+    @pyqtSlot()
+    def on_clear_log_clicked(self):
+        """Clear the log viewer, including lines not yet flushed into it."""
+        self._log_q.clear()
+        self.log_viewer.clear()
+
     @pyqtSlot()
     def on_auth_required(self):
         """Prompt for username and password when authentication is needed."""
@@ -241,23 +547,25 @@ class MainWindow(QMainWindow):
         password, ok = QInputDialog.getText(self, "Authentication", "Password:", echo=QLineEdit.Password)
         if not ok:
             return
-        self.openvpn_controller.send_command(f'username "Auth" {username}')
-        self.openvpn_controller.send_command(f'password "Auth" {password}')
+        self.openvpn_controller.send_commands(f'username "Auth" {username}', f'password "Auth" {password}')
 
     def connect_signals(self):
         """Connect all signals to their slots."""
         self.import_button.clicked.connect(self.on_import_clicked)
         self.connect_button.clicked.connect(self.on_connect_clicked)
         self.disconnect_button.clicked.connect(self.on_disconnect_clicked)
+        self.clear_log_button.clicked.connect(self.on_clear_log_clicked)
         self.connect_signal.connect(self.openvpn_controller.start_openvpn)
         self.disconnect_signal.connect(self.openvpn_controller.disconnect)
-        self.openvpn_controller.state_changed.connect(self.update_status)
-        self.openvpn_controller.log_message.connect(self.append_log)
-        self.openvpn_controller.auth_required.connect(self.on_auth_required)
+        # Controller signals are emitted from the management reader thread
+        self.openvpn_controller.state_changed.connect(self.update_status, Qt.QueuedConnection)
+        self.openvpn_controller.log_message.connect(self.append_log, Qt.QueuedConnection)
+        self.openvpn_controller.auth_required.connect(self.on_auth_required, Qt.QueuedConnection)
 
 # Run the application
 if __name__ == "__main__":
     app = QApplication(sys.argv)
+    app.setStyleSheet(STYLESHEET)
     window = MainWindow()
     window.show()
     sys.exit(app.exec_())
\ No newline at end of file